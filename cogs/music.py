@@ -1,18 +1,106 @@
+import aiohttp
 import discord
+from discord import app_commands
 from discord.ext import commands
 import wavelink
 from wavelink.ext import spotify
 from typing import Optional, Union
 import asyncio
+import itertools
+import json
+from contextlib import nullcontext
+from functools import lru_cache
+from cachetools import TTLCache
+
+import config
+from database import db_manager
+
+# Row template shared by the queue and search listings
+_LINE = "`{i}.` [{title}]({uri}) `{dur}`".format
+
+
+@lru_cache(maxsize=2048)
+def _fmt_ms(ms: int) -> str:
+    """Format a duration in milliseconds as m:ss."""
+    return f"{ms // 60000}:{ms % 60000 // 1000:02d}"
+
+
+def _build_np_embed(track: wavelink.Track) -> discord.Embed:
+    """Build the "Now Playing" announcement for a track."""
+    embed = discord.Embed(
+        title="Now Playing",
+        description=f"[{track.title}]({track.uri})",
+        color=discord.Color.purple()
+    )
+    embed.add_field(name="Duration", value=_fmt_len(track))
+    embed.add_field(name="Author", value=track.author, inline=False)
+    return embed
+
+
+def _fmt_len(track: wavelink.Track) -> str:
+    """Get a track's formatted length, stamped on at ingest when available."""
+    return getattr(track, "_fmt_len", None) or _fmt_ms(track.length)
+
+
+@lru_cache(maxsize=32)
+def _make_bars(length: int) -> tuple:
+    """Build every fill state of a progress bar of the given length."""
+    return tuple("█" * i + "░" * (length - i) for i in range(length + 1))
+
+
+def _cache_key(query: str) -> str:
+    """Normalize a query for the search caches; URLs keep their case-sensitive IDs."""
+    query = query.strip()
+    return query if "://" in query else query.lower()
+
+
+def _typing(ctx: commands.Context):
+    """Typing indicator for a reply, unless a slash invocation was already deferred."""
+    if ctx.interaction and ctx.interaction.response.is_done():
+        return nullcontext()
+    return ctx.typing()
 
 
 class Music(commands.Cog):
     """Music cog with YouTube and Wavelink integration."""
 
+    # Seconds to wait for a track to be queued after the previous one ends
+    TRACK_END_WAIT = 1.5
+
+    # Static replies are built once and reused; embeds are only read when sent
+    _RED = discord.Color.red()
+    _EMB_NOT_PLAYING = discord.Embed(description="❌ No track is currently playing", color=_RED)
+    _EMB_NO_VOICE = discord.Embed(description="❌ You must be connected to a voice channel!", color=_RED)
+    _EMB_QUEUE_EMPTY = discord.Embed(description="📭 Queue is empty", color=discord.Color.orange())
+    _EMB_QUEUE_EMPTY_ERROR = discord.Embed(description="❌ Queue is empty", color=_RED)
+    _EMB_QUEUE_ALREADY_EMPTY = discord.Embed(description="❌ Queue is already empty", color=_RED)
+    _EMB_ALREADY_PAUSED = discord.Embed(description="❌ Track is already paused", color=_RED)
+    _EMB_NOT_PAUSED = discord.Embed(description="❌ No paused track to resume", color=_RED)
+    _EMB_BAD_VOLUME = discord.Embed(description="❌ Volume must be between 0 and 100", color=_RED)
+    _EMB_ALREADY_QUEUED = discord.Embed(description="❌ Track is already in the queue", color=_RED)
+    _EMB_QUEUE_FULL = discord.Embed(description=f"❌ Queue is full ({config.MAX_QUEUE_SIZE} tracks)", color=_RED)
+    _EMB_BAD_LOOP_MODE = discord.Embed(description="❌ Invalid loop mode. Use: `track`, `queue`, or `off`", color=_RED)
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.wavelink: wavelink.Client = wavelink.Client(client=bot)
         bot.add_app_command(self.wavelink)
+        self._search_cache: TTLCache = TTLCache(maxsize=config.MAX_CACHE_SIZE, ttl=config.CACHE_TTL)
+        # query -> [lock, callers]; dropped by the last caller out
+        self._search_locks: dict[str, list] = {}
+        self.http: Optional[aiohttp.ClientSession] = None
+
+    async def cog_load(self) -> None:
+        """Open the HTTP session shared by all outbound requests from this cog."""
+        self.http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=config.CONNECTION_TIMEOUT)
+        )
+
+    async def cog_unload(self) -> None:
+        """Close the shared HTTP session."""
+        if self.http:
+            await self.http.close()
 
     @commands.Cog.listener()
     async def on_wavelink_node_ready(self, node: wavelink.Node) -> None:
@@ -22,117 +110,223 @@ class Music(commands.Cog):
     @commands.Cog.listener()
     async def on_wavelink_track_end(self, player: wavelink.Player, track: wavelink.Track, reason) -> None:
         """Event fired when a track ends."""
-        if player.queue.is_empty:
-            return
+        # Serialize end events (duplicates can arrive around a reconnect)
+        async with player._track_end_lock:
+            # Give a !play racing with the end of the track a moment to enqueue
+            try:
+                next_track = await asyncio.wait_for(player.queue.get_wait(), timeout=self.TRACK_END_WAIT)
+            except asyncio.TimeoutError:
+                return
 
-        next_track = await player.play(player.queue.get())
-        embed = discord.Embed(
-            title="Now Playing",
-            description=f"[{next_track.title}]({next_track.uri})",
-            color=discord.Color.purple()
-        )
-        embed.add_field(name="Duration", value=f"{next_track.length // 60000}:{next_track.length % 60000 // 1000:02d}")
-        embed.add_field(name="Author", value=next_track.author, inline=False)
-        
-        await player.home.send(embed=embed)
+            # A !play that found the player idle may have started a track
+            # directly during the wait; this one then queues behind it
+            if player.is_playing():
+                self._put_top(player, [next_track])
+                return
+
+            player._seen.pop(next_track.identifier, None)
+
+            # The play request goes to Lavalink and the announcement to Discord;
+            # neither depends on the other, so overlap them
+            await asyncio.gather(player.play(next_track), player.home.send(embed=_build_np_embed(next_track)))
+
+    async def _search(self, query: str) -> list:
+        """Search YouTube for tracks, serving repeated queries from the cache.
+
+        Resolution happens on the Lavalink node; the search call here is a
+        non-blocking HTTP request, so it is awaited directly rather than
+        handed to an executor.
+        """
+        if not config.ENABLE_CACHE:
+            return await wavelink.YouTubeTrack.search(query)
+
+        key = _cache_key(query)
+        tracks = self._search_cache.get(key)
+        if tracks is not None:
+            return tracks
+
+        # Only one lookup per query is in flight; concurrent callers wait for it
+        entry = self._search_locks.get(key)
+        if entry is None:
+            entry = self._search_locks[key] = [asyncio.Lock(), 0]
+        lock = entry[0]
+        entry[1] += 1
+        try:
+            async with lock:
+                tracks = self._search_cache.get(key)
+                if tracks is None:
+                    tracks = await self._load_persisted_search(key)
+                if tracks is None:
+                    tracks = await wavelink.YouTubeTrack.search(query)
+                    if tracks:
+                        await self._persist_search(key, tracks)
+                if tracks:
+                    for track in tracks:
+                        track._fmt_len = _fmt_ms(track.length)
+                    self._search_cache[key] = tracks
+                return tracks
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._search_locks[key]
+
+    async def _load_persisted_search(self, key: str) -> Optional[list]:
+        """Rebuild search results saved by a previous run, if they are still fresh."""
+        try:
+            payload = await db_manager.a_get_cached_search(key)
+            if payload is None:
+                return None
+            return [wavelink.YouTubeTrack(data) for data in json.loads(payload)]
+        except Exception as e:
+            # Unreadable or no longer decodable entries are just a miss
+            print(f"Failed to load cached search for {key!r}: {e}")
+            return None
+
+    async def _persist_search(self, key: str, tracks: list) -> None:
+        """Save search results so they survive a restart."""
+        try:
+            payload = json.dumps([track.data for track in tracks])
+            await db_manager.a_cache_search(key, payload, config.CACHE_TTL)
+        except Exception as e:
+            print(f"Failed to save search cache for {key!r}: {e}")
+
+    def _put_top(self, player: wavelink.Player, tracks: list) -> None:
+        """Insert tracks at the front of the queue, keeping their order."""
+        player.queue._queue.extendleft(reversed(tracks))
+        player._seen.update((track.identifier, track) for track in tracks)
+
+    async def _check_enqueue(self, ctx: commands.Context, player: wavelink.Player, track: wavelink.Track) -> bool:
+        """Reject a track that is already queued or would overflow the queue."""
+        if track.identifier in player._seen:
+            await ctx.send(embed=self._EMB_ALREADY_QUEUED, ephemeral=True)
+            return False
+
+        if len(player.queue) >= config.MAX_QUEUE_SIZE:
+            await ctx.send(embed=self._EMB_QUEUE_FULL, ephemeral=True)
+            return False
+
+        return True
+
+    async def _get_player(self, ctx: commands.Context, playing: bool = False) -> Optional[wavelink.Player]:
+        """Get the author's player for a command, replying with the reason when there is none.
+
+        With ``playing=True`` the player is also rejected when nothing is playing.
+        """
+        player = await self.ensure_voice(ctx)
+        if player and playing and not player.is_playing():
+            await ctx.send(embed=self._EMB_NOT_PLAYING, ephemeral=True)
+            return None
+        return player
 
     async def ensure_voice(self, ctx: commands.Context) -> Optional[wavelink.Player]:
         """Ensure user is in a voice channel and bot is connected."""
         if not ctx.author.voice:
-            embed = discord.Embed(
-                description="❌ You must be connected to a voice channel!",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._EMB_NO_VOICE, ephemeral=True)
             return None
 
         player: wavelink.Player = ctx.voice_client
 
         if player is None:
+            # Connecting can outlast the 3s interaction deadline, so
+            # acknowledge a slash invocation that nothing has answered yet
+            if ctx.interaction and not ctx.interaction.response.is_done():
+                await ctx.defer()
             try:
                 player = await ctx.author.voice.channel.connect(cls=wavelink.Player)
                 player.home = ctx.channel
+                player._track_end_lock = asyncio.Lock()
+                # Queued tracks by identifier, for O(1) duplicate checks
+                player._seen = {}
             except discord.ClientException as e:
                 embed = discord.Embed(
                     description=f"❌ Failed to connect: {str(e)}",
-                    color=discord.Color.red()
+                    color=self._RED
                 )
-                await ctx.send(embed=embed)
+                await ctx.send(embed=embed, ephemeral=True)
                 return None
 
         return player
 
-    @commands.command(
+    @commands.hybrid_command(
         name="play",
         aliases=["p"],
         description="Play a song from YouTube"
     )
     async def play(self, ctx: commands.Context, *, query: str) -> None:
         """Play a track from YouTube."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
-        async with ctx.typing():
-            tracks = await wavelink.YouTubeTrack.search(query)
+        async with _typing(ctx):
+            tracks = await self._search(query)
 
             if not tracks:
                 embed = discord.Embed(
                     description=f"❌ No tracks found for `{query}`",
-                    color=discord.Color.red()
+                    color=self._RED
                 )
-                await ctx.send(embed=embed)
+                await ctx.send(embed=embed, ephemeral=True)
                 return
 
             track = tracks[0]
-            await player.queue.put_wait(track)
 
             if not player.is_playing():
-                await player.play(player.queue.get())
+                # Nothing to wait behind: start the stream straight away rather
+                # than round-tripping the track through the queue first
+                playback = asyncio.create_task(player.play(track))
                 embed = discord.Embed(
                     title="🎵 Now Playing",
                     description=f"[{track.title}]({track.uri})",
                     color=discord.Color.purple()
                 )
-                embed.add_field(name="Duration", value=f"{track.length // 60000}:{track.length % 60000 // 1000:02d}")
+                embed.add_field(name="Duration", value=_fmt_len(track))
                 embed.add_field(name="Author", value=track.author)
                 embed.add_field(name="Queue Position", value="1", inline=False)
-                await ctx.send(embed=embed)
+                await asyncio.gather(playback, ctx.send(embed=embed))
             else:
+                if not await self._check_enqueue(ctx, player, track):
+                    return
+
+                player._seen[track.identifier] = track
+                await player.queue.put_wait(track)
                 embed = discord.Embed(
                     title="✅ Added to Queue",
                     description=f"[{track.title}]({track.uri})",
                     color=discord.Color.green()
                 )
                 embed.add_field(name="Position", value=f"#{len(player.queue)}")
-                embed.add_field(name="Duration", value=f"{track.length // 60000}:{track.length % 60000 // 1000:02d}")
+                embed.add_field(name="Duration", value=_fmt_len(track))
                 await ctx.send(embed=embed)
 
-    @commands.command(name="playtop", description="Play a song at the top of the queue")
+    @commands.hybrid_command(name="playtop", description="Play a song at the top of the queue")
     async def playtop(self, ctx: commands.Context, *, query: str) -> None:
         """Play a track at the top of the queue."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
-        async with ctx.typing():
-            tracks = await wavelink.YouTubeTrack.search(query)
+        async with _typing(ctx):
+            tracks = await self._search(query)
 
             if not tracks:
                 embed = discord.Embed(
                     description=f"❌ No tracks found for `{query}`",
-                    color=discord.Color.red()
+                    color=self._RED
                 )
-                await ctx.send(embed=embed)
+                await ctx.send(embed=embed, ephemeral=True)
                 return
 
             track = tracks[0]
-            
-            # Insert at the beginning of queue
-            player.queue._queue.appendleft(track)
-            
+            if not await self._check_enqueue(ctx, player, track):
+                return
+
+            self._put_top(player, [track])
+
             if not player.is_playing():
-                await player.play(player.queue.get())
+                next_track = player.queue.get()
+                player._seen.pop(next_track.identifier, None)
+                await player.play(next_track)
 
             embed = discord.Embed(
                 title="✅ Added to Top of Queue",
@@ -142,21 +336,20 @@ class Music(commands.Cog):
             embed.add_field(name="Position", value="#1")
             await ctx.send(embed=embed)
 
-    @commands.command(name="skip", aliases=["s"], description="Skip the current track")
+    @play.autocomplete("query")
+    @playtop.autocomplete("query")
+    async def query_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        """Suggest tracks for a query from the search cache, without searching YouTube."""
+        tracks = self._search_cache.get(_cache_key(current), [])
+        return [app_commands.Choice(name=track.title[:100], value=track.uri) for track in tracks[:25]]
+
+    @commands.hybrid_command(name="skip", aliases=["s"], description="Skip the current track")
     async def skip(self, ctx: commands.Context) -> None:
         """Skip the current track."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx, playing=True)
         if not player:
             return
 
-        if not player.is_playing():
-            embed = discord.Embed(
-                description="❌ No track is currently playing",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
-            return
-
         current = player.current
         await player.skip()
 
@@ -167,43 +360,40 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="queue", aliases=["q"], description="View the current queue")
+    @commands.hybrid_command(name="queue", aliases=["q"], description="View the current queue")
     async def queue(self, ctx: commands.Context, page: int = 1) -> None:
         """View the current queue."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
-        if len(player.queue) == 0:
-            embed = discord.Embed(
-                description="📭 Queue is empty",
-                color=discord.Color.orange()
-            )
-            await ctx.send(embed=embed)
+        n = len(player.queue)
+        if n == 0:
+            await ctx.send(embed=self._EMB_QUEUE_EMPTY, ephemeral=True)
             return
 
         items_per_page = 10
-        pages = (len(player.queue) + items_per_page - 1) // items_per_page
+        pages = -(-n // items_per_page)
 
         if page > pages or page < 1:
             embed = discord.Embed(
                 description=f"❌ Invalid page number. Total pages: {pages}",
-                color=discord.Color.red()
+                color=self._RED
             )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=embed, ephemeral=True)
             return
 
         start = (page - 1) * items_per_page
         end = start + items_per_page
 
-        queue_list = ""
-        for i, track in enumerate(list(player.queue)[start:end], start=start + 1):
-            duration = f"{track.length // 60000}:{track.length % 60000 // 1000:02d}"
-            queue_list += f"`{i}.` [{track.title}]({track.uri}) `{duration}`\n"
+        lines = [
+            _LINE(i=i, title=track.title, uri=track.uri, dur=_fmt_len(track))
+            for i, track in enumerate(itertools.islice(player.queue._queue, start, end), start=start + 1)
+        ]
 
         embed = discord.Embed(
             title="🎵 Queue",
-            description=queue_list or "No tracks in this page",
+            description="\n".join(lines) or "No tracks in this page",
             color=discord.Color.purple()
         )
         
@@ -214,22 +404,18 @@ class Music(commands.Cog):
                 inline=False
             )
 
-        embed.set_footer(text=f"Page {page}/{pages} | Total tracks: {len(player.queue)}")
+        embed.set_footer(text=f"Page {page}/{pages} | Total tracks: {n}")
         await ctx.send(embed=embed)
 
-    @commands.command(name="pause", description="Pause the current track")
+    @commands.hybrid_command(name="pause", description="Pause the current track")
     async def pause(self, ctx: commands.Context) -> None:
         """Pause the current track."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
         if player.is_paused():
-            embed = discord.Embed(
-                description="❌ Track is already paused",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._EMB_ALREADY_PAUSED, ephemeral=True)
             return
 
         await player.pause(True)
@@ -241,19 +427,15 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="resume", aliases=["r"], description="Resume the paused track")
+    @commands.hybrid_command(name="resume", aliases=["r"], description="Resume the paused track")
     async def resume(self, ctx: commands.Context) -> None:
         """Resume the paused track."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
         if not player.is_paused():
-            embed = discord.Embed(
-                description="❌ No paused track to resume",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._EMB_NOT_PAUSED, ephemeral=True)
             return
 
         await player.pause(False)
@@ -265,15 +447,16 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="stop", description="Stop the music and clear the queue")
+    @commands.hybrid_command(name="stop", description="Stop the music and clear the queue")
     async def stop(self, ctx: commands.Context) -> None:
         """Stop the music and clear the queue."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
         await player.stop()
         player.queue.clear()
+        player._seen.clear()
 
         embed = discord.Embed(
             title="⏹️ Stopped",
@@ -282,10 +465,10 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="leave", aliases=["disconnect", "dc"], description="Disconnect the bot from voice channel")
+    @commands.hybrid_command(name="leave", aliases=["disconnect", "dc"], description="Disconnect the bot from voice channel")
     async def leave(self, ctx: commands.Context) -> None:
         """Disconnect the bot from the voice channel."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
@@ -297,21 +480,13 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="now", aliases=["current", "np"], description="Show the currently playing track")
+    @commands.hybrid_command(name="now", aliases=["current", "np"], description="Show the currently playing track")
     async def now(self, ctx: commands.Context) -> None:
         """Show the currently playing track."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx, playing=True)
         if not player:
             return
 
-        if not player.is_playing():
-            embed = discord.Embed(
-                description="❌ No track is currently playing",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
-            return
-
         track = player.current
         position = player.position
         duration = track.length
@@ -324,32 +499,24 @@ class Music(commands.Cog):
             color=discord.Color.purple()
         )
         embed.add_field(name="Author", value=track.author)
-        embed.add_field(name="Duration", value=f"{duration // 60000}:{duration % 60000 // 1000:02d}")
+        embed.add_field(name="Duration", value=_fmt_len(track))
         embed.add_field(name="Progress", value=progress_bar, inline=False)
         embed.add_field(name="Position in Queue", value=f"1/{len(player.queue) + 1}")
         await ctx.send(embed=embed)
 
-    @commands.command(name="seek", description="Seek to a specific position in the current track")
+    @commands.hybrid_command(name="seek", description="Seek to a specific position in the current track")
     async def seek(self, ctx: commands.Context, seconds: int) -> None:
         """Seek to a specific position in the current track."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx, playing=True)
         if not player:
             return
 
-        if not player.is_playing():
-            embed = discord.Embed(
-                description="❌ No track is currently playing",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
-            return
-
         if seconds < 0 or seconds * 1000 > player.current.length:
             embed = discord.Embed(
                 description=f"❌ Invalid seek position. Track duration: {player.current.length // 1000} seconds",
-                color=discord.Color.red()
+                color=self._RED
             )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=embed, ephemeral=True)
             return
 
         await player.seek(seconds * 1000)
@@ -361,19 +528,15 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="volume", aliases=["vol", "v"], description="Set the player volume (0-100)")
+    @commands.hybrid_command(name="volume", aliases=["vol", "v"], description="Set the player volume (0-100)")
     async def volume(self, ctx: commands.Context, volume: int) -> None:
         """Set the player volume."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
         if volume < 0 or volume > 100:
-            embed = discord.Embed(
-                description="❌ Volume must be between 0 and 100",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._EMB_BAD_VOLUME, ephemeral=True)
             return
 
         await player.set_volume(volume)
@@ -385,31 +548,32 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="remove", description="Remove a track from the queue by position")
+    @commands.hybrid_command(name="remove", description="Remove a track from the queue by position")
     async def remove(self, ctx: commands.Context, position: int) -> None:
         """Remove a track from the queue."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
-        if len(player.queue) == 0:
-            embed = discord.Embed(
-                description="❌ Queue is empty",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+        n = len(player.queue)
+        if n == 0:
+            await ctx.send(embed=self._EMB_QUEUE_EMPTY_ERROR, ephemeral=True)
             return
 
-        if position < 1 or position > len(player.queue):
+        if position < 1 or position > n:
             embed = discord.Embed(
-                description=f"❌ Invalid position. Queue has {len(player.queue)} tracks",
-                color=discord.Color.red()
+                description=f"❌ Invalid position. Queue has {n} tracks",
+                color=self._RED
             )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=embed, ephemeral=True)
             return
 
-        track = player.queue._queue[position - 1]
-        del player.queue._queue[position - 1]
+        # Rotate the target to the front so the removal is a popleft
+        q = player.queue._queue
+        q.rotate(-(position - 1))
+        track = q.popleft()
+        q.rotate(position - 1)
+        player._seen.pop(track.identifier, None)
 
         embed = discord.Embed(
             title="🗑️ Removed from Queue",
@@ -418,22 +582,19 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="clear", description="Clear the entire queue")
+    @commands.hybrid_command(name="clear", description="Clear the entire queue")
     async def clear(self, ctx: commands.Context) -> None:
         """Clear the queue."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
-        if len(player.queue) == 0:
-            embed = discord.Embed(
-                description="❌ Queue is already empty",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+        if player.queue.is_empty:
+            await ctx.send(embed=self._EMB_QUEUE_ALREADY_EMPTY, ephemeral=True)
             return
 
         player.queue.clear()
+        player._seen.clear()
 
         embed = discord.Embed(
             title="🧹 Queue Cleared",
@@ -442,44 +603,37 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="shuffle", description="Shuffle the queue")
+    @commands.hybrid_command(name="shuffle", description="Shuffle the queue")
     async def shuffle(self, ctx: commands.Context) -> None:
         """Shuffle the queue."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
-        if len(player.queue) == 0:
-            embed = discord.Embed(
-                description="❌ Queue is empty",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+        n = len(player.queue)
+        if n == 0:
+            await ctx.send(embed=self._EMB_QUEUE_EMPTY_ERROR, ephemeral=True)
             return
 
         player.queue.shuffle()
 
         embed = discord.Embed(
             title="🔀 Queue Shuffled",
-            description=f"Shuffled {len(player.queue)} tracks",
+            description=f"Shuffled {n} tracks",
             color=discord.Color.blue()
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="loop", description="Loop the current track or queue")
+    @commands.hybrid_command(name="loop", description="Loop the current track or queue")
     async def loop(self, ctx: commands.Context, mode: str = "track") -> None:
         """Set loop mode for the current track or queue."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
         mode = mode.lower()
         if mode not in ["track", "queue", "off"]:
-            embed = discord.Embed(
-                description="❌ Invalid loop mode. Use: `track`, `queue`, or `off`",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._EMB_BAD_LOOP_MODE, ephemeral=True)
             return
 
         if mode == "track":
@@ -499,24 +653,24 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="search", description="Search for a track without playing it")
+    @commands.hybrid_command(name="search", description="Search for a track without playing it")
     async def search(self, ctx: commands.Context, *, query: str) -> None:
         """Search for tracks."""
         async with ctx.typing():
-            tracks = await wavelink.YouTubeTrack.search(query)
+            tracks = await self._search(query)
 
             if not tracks:
                 embed = discord.Embed(
                     description=f"❌ No tracks found for `{query}`",
-                    color=discord.Color.red()
+                    color=self._RED
                 )
-                await ctx.send(embed=embed)
+                await ctx.send(embed=embed, ephemeral=True)
                 return
 
-            results = ""
-            for i, track in enumerate(tracks[:10], 1):
-                duration = f"{track.length // 60000}:{track.length % 60000 // 1000:02d}"
-                results += f"`{i}.` [{track.title}]({track.uri}) `{duration}`\n"
+            results = "\n".join(
+                _LINE(i=i, title=track.title, uri=track.uri, dur=_fmt_len(track))
+                for i, track in enumerate(tracks[:10], 1)
+            )
 
             embed = discord.Embed(
                 title=f"🔍 Search Results for '{query}'",
@@ -526,21 +680,13 @@ class Music(commands.Cog):
             embed.set_footer(text="Use !play [track name] to play")
             await ctx.send(embed=embed)
 
-    @commands.command(name="lyrics", description="Get lyrics for the current track")
+    @commands.hybrid_command(name="lyrics", description="Get lyrics for the current track")
     async def lyrics(self, ctx: commands.Context) -> None:
         """Get lyrics for the current track."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx, playing=True)
         if not player:
             return
 
-        if not player.is_playing():
-            embed = discord.Embed(
-                description="❌ No track is currently playing",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
-            return
-
         embed = discord.Embed(
             title="🎵 Lyrics",
             description=f"Lyrics feature coming soon for [{player.current.title}]({player.current.uri})",
@@ -548,23 +694,15 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="info", description="Get information about the current track")
+    @commands.hybrid_command(name="info", description="Get information about the current track")
     async def info(self, ctx: commands.Context) -> None:
         """Get information about the current track."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx, playing=True)
         if not player:
             return
 
-        if not player.is_playing():
-            embed = discord.Embed(
-                description="❌ No track is currently playing",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
-            return
-
         track = player.current
-        duration = f"{track.length // 60000}:{track.length % 60000 // 1000:02d}"
+        duration = _fmt_len(track)
 
         embed = discord.Embed(
             title="ℹ️ Track Information",
@@ -577,21 +715,13 @@ class Music(commands.Cog):
         embed.add_field(name="Isrc", value=track.isrc or "N/A")
         await ctx.send(embed=embed)
 
-    @commands.command(name="rewind", description="Rewind the track by 10 seconds")
+    @commands.hybrid_command(name="rewind", description="Rewind the track by 10 seconds")
     async def rewind(self, ctx: commands.Context, seconds: int = 10) -> None:
         """Rewind the current track."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx, playing=True)
         if not player:
             return
 
-        if not player.is_playing():
-            embed = discord.Embed(
-                description="❌ No track is currently playing",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
-            return
-
         new_position = max(0, player.position - (seconds * 1000))
         await player.seek(new_position)
 
@@ -602,21 +732,13 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="forward", description="Forward the track by 10 seconds")
+    @commands.hybrid_command(name="forward", description="Forward the track by 10 seconds")
     async def forward(self, ctx: commands.Context, seconds: int = 10) -> None:
         """Forward the current track."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx, playing=True)
         if not player:
             return
 
-        if not player.is_playing():
-            embed = discord.Embed(
-                description="❌ No track is currently playing",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
-            return
-
         new_position = min(player.current.length, player.position + (seconds * 1000))
         await player.seek(new_position)
 
@@ -627,10 +749,10 @@ class Music(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.command(name="playing", description="Check if the bot is playing music")
+    @commands.hybrid_command(name="playing", description="Check if the bot is playing music")
     async def playing(self, ctx: commands.Context) -> None:
         """Check if the bot is playing music."""
-        player = await self.ensure_voice(ctx)
+        player = await self._get_player(ctx)
         if not player:
             return
 
@@ -661,11 +783,11 @@ class Music(commands.Cog):
         else:
             percent = current / total
 
-        filled = int(bar_length * percent)
-        bar = "█" * filled + "░" * (bar_length - filled)
+        filled = min(max(int(bar_length * percent), 0), bar_length)
+        bar = _make_bars(bar_length)[filled]
         
-        current_time = f"{current // 60000}:{current % 60000 // 1000:02d}"
-        total_time = f"{total // 60000}:{total % 60000 // 1000:02d}"
+        current_time = _fmt_ms(current)
+        total_time = _fmt_ms(total)
         
         return f"`{bar}` {current_time}/{total_time}"
 
@@ -4,9 +4,17 @@ Handles all database operations including connection management,
 table creation, and CRUD operations.
 """
 
+import asyncio
+import concurrent.futures
+import functools
 import sqlite3
 import os
-from typing import Optional, List, Dict, Any, Tuple
+import queue
+import threading
+import time
+import types
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterator
 from contextlib import contextmanager
 from pathlib import Path
 import logging
@@ -15,6 +23,386 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Per-connection prepared statement cache (sqlite3 defaults to 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Page size for newly created databases, and per-connection memory-mapped I/O
+# window and page cache size (KiB) for read-heavy workloads
+PAGE_SIZE = 8192
+MMAP_SIZE = 256 * 1024 * 1024
+CACHE_SIZE_KIB = 65536
+
+# Entries kept per read-through row cache (users, songs, preferences)
+ROW_CACHE_SIZE = 2048
+
+# Tables counted by get_database_stats
+STATS_TABLES = ('users', 'songs', 'playlists', 'playback_history')
+
+# All SQL issued by DatabaseManager, built once so every call reuses the same
+# string object and hits the per-connection statement cache
+_SQL = types.SimpleNamespace(
+    GET_USER="SELECT * FROM users WHERE user_id = ?",
+    ADD_USER="""
+        INSERT INTO users (user_id, username)
+        VALUES (?, ?)
+    """,
+    GET_ALL_USERS="SELECT * FROM users",
+    GET_SONG="SELECT * FROM songs WHERE id = ?",
+    ADD_SONG="""
+        INSERT INTO songs (title, artist, duration, url, file_path)
+        VALUES (?, ?, ?, ?, ?)
+        RETURNING id
+    """,
+    ADD_SONGS="""
+        INSERT OR IGNORE INTO songs (title, artist, duration, url, file_path)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+    SEARCH_SONGS_FTS="""
+        SELECT s.* FROM songs s
+        JOIN songs_fts f ON f.rowid = s.id
+        WHERE songs_fts MATCH ?
+        ORDER BY s.title
+    """,
+    SEARCH_SONGS_LIKE="""
+        SELECT * FROM songs
+        WHERE title LIKE ? OR artist LIKE ?
+        ORDER BY title
+    """,
+    CREATE_PLAYLIST="""
+        INSERT INTO playlists (user_id, playlist_name, description)
+        VALUES (?, ?, ?)
+        RETURNING id
+    """,
+    GET_USER_PLAYLISTS="""
+        SELECT * FROM playlists
+        WHERE user_id = ?
+        ORDER BY updated_at DESC
+    """,
+    GET_PLAYLIST="SELECT * FROM playlists WHERE id = ?",
+    DELETE_PLAYLIST="DELETE FROM playlists WHERE id = ?",
+    ADD_PLAYLIST_SONG="""
+        INSERT INTO playlist_songs (playlist_id, song_id, position)
+        VALUES (?, ?, COALESCE(?, (
+            SELECT MAX(position) + 1 FROM playlist_songs WHERE playlist_id = ?
+        ), 1))
+    """,
+    GET_PLAYLIST_SONGS="""
+        SELECT s.*, ps.position, ps.added_at
+        FROM songs s
+        JOIN playlist_songs ps ON s.id = ps.song_id
+        WHERE ps.playlist_id = ?
+        ORDER BY ps.position
+    """,
+    REMOVE_PLAYLIST_SONG="""
+        DELETE FROM playlist_songs
+        WHERE playlist_id = ? AND song_id = ?
+    """,
+    GET_USER_PREFERENCES="SELECT * FROM user_preferences WHERE user_id = ?",
+    LOG_PLAYBACK="INSERT INTO playback_history (user_id, song_id, duration_played) VALUES (?, ?, ?)",
+    GET_USER_HISTORY="""
+        SELECT ph.*, s.title, s.artist
+        FROM playback_history ph
+        JOIN songs s ON ph.song_id = s.id
+        WHERE ph.user_id = ?
+        ORDER BY ph.played_at DESC
+        LIMIT ?
+    """,
+    CLEAR_USER_HISTORY="DELETE FROM playback_history WHERE user_id = ?",
+    CLEAR_HISTORY="DELETE FROM playback_history",
+    GET_CACHED_SEARCH="""
+        SELECT payload FROM search_cache
+        WHERE query = ? AND expires_at > ?
+    """,
+    CACHE_SEARCH="""
+        INSERT OR REPLACE INTO search_cache (query, payload, expires_at)
+        VALUES (?, ?, ?)
+    """,
+    PURGE_SEARCH_CACHE="DELETE FROM search_cache WHERE expires_at <= ?",
+    GET_DATABASE_STATS="SELECT " + ", ".join(
+        f"(SELECT COUNT(*) FROM {table}) AS {table}" for table in STATS_TABLES
+    ),
+    FIND_SEARCH_INDEX="SELECT 1 FROM sqlite_master WHERE name = 'songs_fts'",
+    CREATE_SEARCH_INDEX="""
+        CREATE VIRTUAL TABLE IF NOT EXISTS songs_fts USING fts5(
+            title, artist,
+            content='songs', content_rowid='id', tokenize='trigram'
+        )
+    """,
+    REBUILD_SEARCH_INDEX="INSERT INTO songs_fts (songs_fts) VALUES ('rebuild')",
+)
+
+# Playlist entries are clustered by (playlist_id, position), so a playlist
+# is read back in order straight off the primary key; they go away with
+# their playlist or song
+PLAYLIST_SONGS_COLUMNS = """(
+    playlist_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    song_id INTEGER NOT NULL,
+    added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (playlist_id, position),
+    FOREIGN KEY (playlist_id) REFERENCES playlists(id) ON DELETE CASCADE,
+    FOREIGN KEY (song_id) REFERENCES songs(id) ON DELETE CASCADE,
+    UNIQUE(playlist_id, song_id)
+) WITHOUT ROWID"""
+
+# Serves the ON DELETE CASCADE lookup when a song is deleted
+PLAYLIST_SONGS_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_ps_song ON playlist_songs(song_id);
+"""
+
+# Tables and indexes, created in a single transaction at startup
+SCHEMA = f"""
+-- Users table
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT UNIQUE NOT NULL,
+    username TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Playlists table
+CREATE TABLE IF NOT EXISTS playlists (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    playlist_name TEXT NOT NULL,
+    description TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id)
+);
+
+-- Songs table
+CREATE TABLE IF NOT EXISTS songs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    artist TEXT NOT NULL,
+    duration INTEGER,
+    url TEXT UNIQUE,
+    file_path TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Playlist Songs (junction table)
+CREATE TABLE IF NOT EXISTS playlist_songs {PLAYLIST_SONGS_COLUMNS};
+
+-- User Preferences table
+CREATE TABLE IF NOT EXISTS user_preferences (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT UNIQUE NOT NULL,
+    theme TEXT DEFAULT 'dark',
+    volume INTEGER DEFAULT 50,
+    language TEXT DEFAULT 'en',
+    auto_play BOOLEAN DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id)
+);
+
+-- Playback History table
+CREATE TABLE IF NOT EXISTS playback_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    song_id INTEGER NOT NULL,
+    played_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    duration_played INTEGER,
+    FOREIGN KEY (user_id) REFERENCES users(user_id),
+    FOREIGN KEY (song_id) REFERENCES songs(id)
+);
+
+-- Search Cache table
+CREATE TABLE IF NOT EXISTS search_cache (
+    query TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    expires_at INTEGER NOT NULL
+);
+
+-- Indexes for the lookup and ordering predicates used by DatabaseManager
+CREATE INDEX IF NOT EXISTS idx_playlists_user ON playlists(user_id);
+{PLAYLIST_SONGS_INDEX.strip()}
+CREATE INDEX IF NOT EXISTS idx_history_user_time ON playback_history(user_id, played_at DESC);
+CREATE INDEX IF NOT EXISTS idx_songs_title ON songs(title);
+CREATE INDEX IF NOT EXISTS idx_songs_artist ON songs(artist);
+CREATE INDEX IF NOT EXISTS idx_search_cache_expiry ON search_cache(expires_at);
+"""
+
+# Rebuild playlist_songs in the current layout, keeping its rows in order.
+# Positions are renumbered per playlist since older layouts allowed NULL or
+# repeated positions; rows pointing at deleted playlists or songs are dropped
+MIGRATE_PLAYLIST_SONGS = f"""
+CREATE TABLE playlist_songs_new {PLAYLIST_SONGS_COLUMNS};
+INSERT INTO playlist_songs_new (playlist_id, position, song_id, added_at)
+SELECT playlist_id,
+       ROW_NUMBER() OVER (PARTITION BY playlist_id ORDER BY position, id),
+       song_id, added_at
+FROM playlist_songs
+WHERE playlist_id IN (SELECT id FROM playlists) AND song_id IN (SELECT id FROM songs);
+DROP TABLE playlist_songs;
+ALTER TABLE playlist_songs_new RENAME TO playlist_songs;
+{PLAYLIST_SONGS_INDEX}
+"""
+
+# Keep the external-content full-text index in step with the songs table
+SEARCH_INDEX_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS songs_fts_insert AFTER INSERT ON songs BEGIN
+    INSERT INTO songs_fts (rowid, title, artist) VALUES (new.id, new.title, new.artist);
+END;
+
+CREATE TRIGGER IF NOT EXISTS songs_fts_delete AFTER DELETE ON songs BEGIN
+    INSERT INTO songs_fts (songs_fts, rowid, title, artist)
+    VALUES ('delete', old.id, old.title, old.artist);
+END;
+
+CREATE TRIGGER IF NOT EXISTS songs_fts_update AFTER UPDATE ON songs BEGIN
+    INSERT INTO songs_fts (songs_fts, rowid, title, artist)
+    VALUES ('delete', old.id, old.title, old.artist);
+    INSERT INTO songs_fts (rowid, title, artist) VALUES (new.id, new.title, new.artist);
+END;
+"""
+
+
+def _execute_script(cursor: sqlite3.Cursor, script: str) -> None:
+    """
+    Run a multi-statement script inside the caller's transaction
+    Unlike executescript, this doesn't commit whatever is already open
+    """
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            cursor.execute(statement)
+            statement = ""
+
+
+@functools.lru_cache(maxsize=256)
+def _row_keys(description: Tuple[Tuple, ...]) -> Tuple[str, ...]:
+    """Column names for a cursor description, shared by every row of a query"""
+    return tuple(column[0] for column in description)
+
+
+def _dict_row_factory(cursor: sqlite3.Cursor, row: Tuple) -> Dict[str, Any]:
+    """Build each result row straight into a dict, without an intermediate sqlite3.Row"""
+    return dict(zip(_row_keys(cursor.description), row))
+
+
+@functools.lru_cache(maxsize=64)
+def _preference_upsert_sql(columns: Tuple[str, ...]) -> str:
+    """Build the insert-or-update statement for a set of preference columns"""
+    cols = ", ".join(("user_id",) + columns)
+    placeholders = ", ".join(["?"] * (len(columns) + 1))
+    updates = "".join(f"{col} = excluded.{col}, " for col in columns)
+    return f"""
+        INSERT INTO user_preferences ({cols})
+        VALUES ({placeholders})
+        ON CONFLICT(user_id) DO UPDATE SET {updates}updated_at = CURRENT_TIMESTAMP
+    """
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used mapping with per-key invalidation
+    A generation counter lets readers drop results that raced a write
+    """
+
+    MISSING = object()
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.generation = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or LRUCache.MISSING"""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return self.MISSING
+            return self._data[key]
+
+    def put(self, key: Any, value: Any, generation: int) -> None:
+        """Store a value read at the given generation, unless a write has happened since"""
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        """Invalidate a single key"""
+        with self._lock:
+            self.generation += 1
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Invalidate every key"""
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+
+class SQLiteConnectionPool:
+    """
+    Thread-safe pool of reusable SQLite connections
+    Connections are opened lazily up to the pool size and configured once
+    """
+
+    def __init__(self, db_path: str, size: int = 5,
+                 configure: Optional[Callable[[sqlite3.Connection], None]] = None):
+        """
+        Initialize the connection pool
+        
+        Args:
+            db_path: Path to SQLite database file
+            size: Maximum number of open connections
+            configure: Optional callback run on each new connection
+        """
+        self.db_path = db_path
+        self.size = size
+        self._configure = configure
+        self._idle: queue.Queue = queue.Queue()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection"""
+        # Autocommit at the driver level: transactions are opened explicitly
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = _dict_row_factory
+        if self._configure:
+            self._configure(conn)
+        return conn
+
+    def get(self) -> sqlite3.Connection:
+        """Check out a connection, blocking if all of them are in use"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._connections) < self.size:
+                conn = self._connect()
+                self._connections.append(conn)
+                return conn
+
+        return self._idle.get()
+
+    def put(self, conn: sqlite3.Connection) -> None:
+        """Return a checked-out connection to the pool"""
+        self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close every connection opened by the pool"""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._idle = queue.Queue()
+
 
 class DatabaseManager:
     """
@@ -22,16 +410,32 @@ class DatabaseManager:
     Provides connection pooling, transaction management, and common operations
     """
 
-    def __init__(self, db_path: str = "musicbot.db"):
+    def __init__(self, db_path: str = "musicbot.db", pool_size: int = 5):
         """
         Initialize the database manager
         
         Args:
             db_path: Path to SQLite database file
+            pool_size: Number of pooled connections used for reads
         """
         self.db_path = db_path
-        self.connection = None
         self._ensure_database_exists()
+        # SQLite allows a single writer, so writes get one dedicated connection
+        # and are serialized behind a lock rather than queueing on SQLite's own
+        self._write_lock = threading.Lock()
+        self._writer = SQLiteConnectionPool(db_path, size=1, configure=self._configure_connection)
+        if db_path == ":memory:":
+            # Every in-memory connection is a separate database; share the writer
+            self._readers = self._writer
+        else:
+            self._readers = SQLiteConnectionPool(db_path, size=pool_size, configure=self._configure_connection)
+        # One worker per pooled reader, so an executor thread never waits on the pool
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="db")
+        # Read-through caches for rows that are read far more often than written;
+        # every write method that touches them invalidates after committing
+        self._user_cache = LRUCache(ROW_CACHE_SIZE)
+        self._song_cache = LRUCache(ROW_CACHE_SIZE)
+        self._preference_cache = LRUCache(ROW_CACHE_SIZE)
         self._initialize_tables()
 
     def _ensure_database_exists(self) -> None:
@@ -42,110 +446,148 @@ class DatabaseManager:
             logger.info(f"Created database directory: {db_dir}")
 
     @contextmanager
-    def get_connection(self):
+    def _read_conn(self):
         """
-        Context manager for database connections
-        Ensures proper connection handling and cleanup
+        Context manager for a pooled reader connection
+        Reads run without a transaction of their own, so nothing is committed
         """
+        conn = self._readers.get()
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
             yield conn
-            conn.commit()
-        except sqlite3.Error as e:
-            logger.error(f"Database error: {e}")
-            if conn:
-                conn.rollback()
-            raise
         finally:
-            if conn:
-                conn.close()
+            self._readers.put(conn)
+
+    @contextmanager
+    def _write_conn(self):
+        """
+        Context manager for the dedicated writer connection
+        Holds the write lock, commits on success and rolls back on error;
+        BEGIN IMMEDIATE takes SQLite's write lock up front
+        """
+        with self._write_lock:
+            conn = self._writer.get()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                yield conn
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                logger.error(f"Database error: {e}")
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                self._writer.put(conn)
+
+    def get_connection(self, write: bool = False):
+        """
+        Context manager for pooled database connections
+        
+        Args:
+            write: Use the dedicated writer connection instead of a reader
+        """
+        return self._write_conn() if write else self._read_conn()
+
+    def _read_through(self, cache: LRUCache, key: Any,
+                      load: Callable[[Any], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """Serve a row from cache, loading and caching it (misses included) on first use"""
+        row = cache.get(key)
+        if row is LRUCache.MISSING:
+            generation = cache.generation
+            row = load(key)
+            cache.put(key, row, generation)
+        # Hand out a copy so callers can't modify the cached row
+        return dict(row) if row is not None else None
+
+    async def run_async(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking database method on the database executor
+        Keeps SQLite I/O and the write lock off the asyncio event loop
+        
+        Args:
+            func: DatabaseManager method to call
+            *args, **kwargs: Arguments passed to func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def __getattr__(self, name: str) -> Callable:
+        """Resolve a_<method> to an awaitable version of <method>, e.g. await db.a_add_song(...)"""
+        # Generators would only be created on the executor and then iterated,
+        # SQLite and all, on the event loop; await the list variants instead
+        if not name.startswith("a_") or name.startswith("a_iter_"):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        func = getattr(self, name[2:])
+
+        async def wrapper(*args, **kwargs):
+            return await self.run_async(func, *args, **kwargs)
+
+        wrapper.__name__ = name
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """Apply performance PRAGMAs to a freshly opened connection (once per connection)"""
+        if conn.execute("PRAGMA page_count").fetchone()["page_count"] == 0:
+            # Only a brand-new database can take a page size, and it has to be
+            # set before switching to WAL, which writes the first page
+            conn.execute(f"PRAGMA page_size={PAGE_SIZE}")
+        if self.db_path != ":memory:":
+            # WAL lets readers run alongside the writer and turns commits into appends
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Read pages straight out of the OS page cache instead of copying them in
+            conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KIB}")
+        conn.execute("PRAGMA foreign_keys=ON")
 
     def _initialize_tables(self) -> None:
         """Create necessary database tables"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Users table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT UNIQUE NOT NULL,
-                    username TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Playlists table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS playlists (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT NOT NULL,
-                    playlist_name TEXT NOT NULL,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users(user_id)
-                )
-            """)
-            
-            # Songs table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS songs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    artist TEXT NOT NULL,
-                    duration INTEGER,
-                    url TEXT UNIQUE,
-                    file_path TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Playlist Songs (junction table)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS playlist_songs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    playlist_id INTEGER NOT NULL,
-                    song_id INTEGER NOT NULL,
-                    position INTEGER,
-                    added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (playlist_id) REFERENCES playlists(id),
-                    FOREIGN KEY (song_id) REFERENCES songs(id),
-                    UNIQUE(playlist_id, song_id)
-                )
-            """)
-            
-            # User Preferences table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS user_preferences (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT UNIQUE NOT NULL,
-                    theme TEXT DEFAULT 'dark',
-                    volume INTEGER DEFAULT 50,
-                    language TEXT DEFAULT 'en',
-                    auto_play BOOLEAN DEFAULT 0,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users(user_id)
-                )
-            """)
-            
-            # Playback History table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS playback_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT NOT NULL,
-                    song_id INTEGER NOT NULL,
-                    played_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    duration_played INTEGER,
-                    FOREIGN KEY (user_id) REFERENCES users(user_id),
-                    FOREIGN KEY (song_id) REFERENCES songs(id)
-                )
-            """)
+        # Schema, migration and search index are set up in one transaction,
+        # so a first run commits once and a failed upgrade leaves nothing behind
+        with self._write_conn() as conn:
+            _execute_script(conn.cursor(), SCHEMA)
+            self._migrate_playlist_songs(conn.cursor())
+            self._fts_enabled = self._initialize_search_index(conn.cursor())
             
             logger.info("Database tables initialized successfully")
 
+    def _migrate_playlist_songs(self, cursor: sqlite3.Cursor) -> None:
+        """Upgrade playlist_songs from the older rowid-keyed layouts"""
+        cursor.execute("PRAGMA table_info(playlist_songs)")
+        if not any(row["name"] == "id" for row in cursor.fetchall()):
+            return
+        
+        _execute_script(cursor, MIGRATE_PLAYLIST_SONGS)
+        logger.info("Migrated playlist_songs to the clustered WITHOUT ROWID layout")
+
+    def _initialize_search_index(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the full-text index used by search_songs
+        
+        Returns:
+            True if FTS5 is available and the index is ready
+        """
+        cursor.execute(_SQL.FIND_SEARCH_INDEX)
+        exists = cursor.fetchone() is not None
+        try:
+            # Trigram tokens keep the substring semantics of the LIKE search
+            cursor.execute(_SQL.CREATE_SEARCH_INDEX)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search unavailable, using LIKE scans: {e}")
+            return False
+        
+        _execute_script(cursor, SEARCH_INDEX_TRIGGERS)
+        if not exists:
+            # Index songs stored before the index existed
+            cursor.execute(_SQL.REBUILD_SEARCH_INDEX)
+        return True
+
     # User Operations
     def add_user(self, user_id: str, username: str) -> bool:
         """
@@ -159,32 +601,41 @@ class DatabaseManager:
             True if successful, False otherwise
         """
         try:
-            with self.get_connection() as conn:
+            with self._write_conn() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO users (user_id, username)
-                    VALUES (?, ?)
-                """, (user_id, username))
-                logger.info(f"User {username} added successfully")
-                return True
+                cursor.execute(_SQL.ADD_USER, (user_id, username))
         except sqlite3.IntegrityError:
             logger.warning(f"User {user_id} already exists")
             return False
+        self._user_cache.pop(user_id)
+        logger.info(f"User {username} added successfully")
+        return True
 
     def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user information by user_id"""
-        with self.get_connection() as conn:
+        return self._read_through(self._user_cache, user_id, self._get_user_uncached)
+
+    def _get_user_uncached(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch the user row from the database, bypassing the cache"""
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            cursor.execute(_SQL.GET_USER, (user_id,))
+            return cursor.fetchone()
 
     def get_all_users(self) -> List[Dict[str, Any]]:
         """Get all users from database"""
-        with self.get_connection() as conn:
+        return list(self.iter_all_users())
+
+    def iter_all_users(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all users in the database
+        Rows are streamed from the cursor, so the pooled connection is held
+        until the iterator is exhausted or closed
+        """
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM users")
-            return [dict(row) for row in cursor.fetchall()]
+            cursor.execute(_SQL.GET_ALL_USERS)
+            yield from cursor
 
     # Song Operations
     def add_song(self, title: str, artist: str, duration: int, 
@@ -203,37 +654,70 @@ class DatabaseManager:
             Song ID if successful, None otherwise
         """
         try:
-            with self.get_connection() as conn:
+            with self._write_conn() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO songs (title, artist, duration, url, file_path)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (title, artist, duration, url, file_path))
-                song_id = cursor.lastrowid
-                logger.info(f"Song '{title}' by {artist} added with ID {song_id}")
-                return song_id
+                cursor.execute(_SQL.ADD_SONG, (title, artist, duration, url, file_path))
+                song_id = cursor.fetchone()["id"]
         except sqlite3.IntegrityError:
             logger.warning(f"Song URL {url} already exists")
             return None
+        self._song_cache.pop(song_id)
+        logger.info(f"Song '{title}' by {artist} added with ID {song_id}")
+        return song_id
+
+    def add_songs(self, rows: List[Tuple[str, str, int, Optional[str], Optional[str]]]) -> int:
+        """
+        Add several songs in a single transaction, skipping duplicate URLs
+        
+        Args:
+            rows: (title, artist, duration, url, file_path) tuples
+            
+        Returns:
+            Number of songs inserted
+        """
+        try:
+            with self._write_conn() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(_SQL.ADD_SONGS, rows)
+        except sqlite3.Error as e:
+            logger.error(f"Error adding songs: {e}")
+            return 0
+        # New IDs aren't known here, so drop any cached misses wholesale
+        if cursor.rowcount:
+            self._song_cache.clear()
+        logger.info(f"{cursor.rowcount} song(s) added")
+        return cursor.rowcount
 
     def get_song(self, song_id: int) -> Optional[Dict[str, Any]]:
         """Get song information by ID"""
-        with self.get_connection() as conn:
+        return self._read_through(self._song_cache, song_id, self._get_song_uncached)
+
+    def _get_song_uncached(self, song_id: int) -> Optional[Dict[str, Any]]:
+        """Fetch the song row from the database, bypassing the cache"""
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM songs WHERE id = ?", (song_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            cursor.execute(_SQL.GET_SONG, (song_id,))
+            return cursor.fetchone()
 
     def search_songs(self, query: str) -> List[Dict[str, Any]]:
         """Search songs by title or artist"""
-        with self.get_connection() as conn:
+        return list(self.iter_search_songs(query))
+
+    def iter_search_songs(self, query: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over songs whose title or artist matches the query
+        Rows are streamed from the cursor, so the pooled connection is held
+        until the iterator is exhausted or closed
+        """
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM songs 
-                WHERE title LIKE ? OR artist LIKE ?
-                ORDER BY title
-            """, (f"%{query}%", f"%{query}%"))
-            return [dict(row) for row in cursor.fetchall()]
+            # Trigram matching needs at least three characters
+            if self._fts_enabled and len(query) >= 3:
+                phrase = '"' + query.replace('"', '""') + '"'
+                cursor.execute(_SQL.SEARCH_SONGS_FTS, (phrase,))
+            else:
+                cursor.execute(_SQL.SEARCH_SONGS_LIKE, (f"%{query}%", f"%{query}%"))
+            yield from cursor
 
     # Playlist Operations
     def create_playlist(self, user_id: str, playlist_name: str, 
@@ -250,13 +734,10 @@ class DatabaseManager:
             Playlist ID if successful, None otherwise
         """
         try:
-            with self.get_connection() as conn:
+            with self._write_conn() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO playlists (user_id, playlist_name, description)
-                    VALUES (?, ?, ?)
-                """, (user_id, playlist_name, description))
-                playlist_id = cursor.lastrowid
+                cursor.execute(_SQL.CREATE_PLAYLIST, (user_id, playlist_name, description))
+                playlist_id = cursor.fetchone()["id"]
                 logger.info(f"Playlist '{playlist_name}' created with ID {playlist_id}")
                 return playlist_id
         except sqlite3.Error as e:
@@ -265,32 +746,25 @@ class DatabaseManager:
 
     def get_user_playlists(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all playlists for a user"""
-        with self.get_connection() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM playlists 
-                WHERE user_id = ?
-                ORDER BY updated_at DESC
-            """, (user_id,))
-            return [dict(row) for row in cursor.fetchall()]
+            cursor.execute(_SQL.GET_USER_PLAYLISTS, (user_id,))
+            return cursor.fetchall()
 
     def get_playlist(self, playlist_id: int) -> Optional[Dict[str, Any]]:
         """Get playlist information by ID"""
-        with self.get_connection() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM playlists WHERE id = ?", (playlist_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            cursor.execute(_SQL.GET_PLAYLIST, (playlist_id,))
+            return cursor.fetchone()
 
     def delete_playlist(self, playlist_id: int) -> bool:
         """Delete a playlist and its songs"""
         try:
-            with self.get_connection() as conn:
+            with self._write_conn() as conn:
                 cursor = conn.cursor()
-                # Delete playlist songs first
-                cursor.execute("DELETE FROM playlist_songs WHERE playlist_id = ?", (playlist_id,))
-                # Delete playlist
-                cursor.execute("DELETE FROM playlists WHERE id = ?", (playlist_id,))
+                # Playlist songs are removed by ON DELETE CASCADE
+                cursor.execute(_SQL.DELETE_PLAYLIST, (playlist_id,))
                 logger.info(f"Playlist {playlist_id} deleted successfully")
                 return True
         except sqlite3.Error as e:
@@ -312,49 +786,37 @@ class DatabaseManager:
             True if successful, False otherwise
         """
         try:
-            with self.get_connection() as conn:
+            with self._write_conn() as conn:
                 cursor = conn.cursor()
-                
-                if position is None:
-                    # Get the next position
-                    cursor.execute("""
-                        SELECT MAX(position) FROM playlist_songs WHERE playlist_id = ?
-                    """, (playlist_id,))
-                    result = cursor.fetchone()
-                    position = (result[0] or 0) + 1
-                
-                cursor.execute("""
-                    INSERT INTO playlist_songs (playlist_id, song_id, position)
-                    VALUES (?, ?, ?)
-                """, (playlist_id, song_id, position))
+                # Without an explicit position, append after the current last one
+                cursor.execute(_SQL.ADD_PLAYLIST_SONG, (playlist_id, song_id, position, playlist_id))
                 logger.info(f"Song {song_id} added to playlist {playlist_id}")
                 return True
         except sqlite3.IntegrityError:
-            logger.warning(f"Song {song_id} already in playlist {playlist_id}")
+            logger.warning(f"Song {song_id} already in playlist {playlist_id} or position taken")
             return False
 
     def get_playlist_songs(self, playlist_id: int) -> List[Dict[str, Any]]:
         """Get all songs in a playlist"""
-        with self.get_connection() as conn:
+        return list(self.iter_playlist_songs(playlist_id))
+
+    def iter_playlist_songs(self, playlist_id: int) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the songs in a playlist, in playlist order
+        Rows are streamed from the cursor, so the pooled connection is held
+        until the iterator is exhausted or closed
+        """
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT s.*, ps.position, ps.added_at
-                FROM songs s
-                JOIN playlist_songs ps ON s.id = ps.song_id
-                WHERE ps.playlist_id = ?
-                ORDER BY ps.position
-            """, (playlist_id,))
-            return [dict(row) for row in cursor.fetchall()]
+            cursor.execute(_SQL.GET_PLAYLIST_SONGS, (playlist_id,))
+            yield from cursor
 
     def remove_song_from_playlist(self, playlist_id: int, song_id: int) -> bool:
         """Remove a song from a playlist"""
         try:
-            with self.get_connection() as conn:
+            with self._write_conn() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    DELETE FROM playlist_songs 
-                    WHERE playlist_id = ? AND song_id = ?
-                """, (playlist_id, song_id))
+                cursor.execute(_SQL.REMOVE_PLAYLIST_SONG, (playlist_id, song_id))
                 logger.info(f"Song {song_id} removed from playlist {playlist_id}")
                 return True
         except sqlite3.Error as e:
@@ -374,45 +836,28 @@ class DatabaseManager:
             True if successful
         """
         try:
-            with self.get_connection() as conn:
+            with self._write_conn() as conn:
                 cursor = conn.cursor()
-                
-                # Check if preferences exist
-                cursor.execute("SELECT id FROM user_preferences WHERE user_id = ?", (user_id,))
-                exists = cursor.fetchone()
-                
-                if exists:
-                    # Update existing preferences
-                    set_clause = ", ".join([f"{k} = ?" for k in preferences.keys()])
-                    values = list(preferences.values()) + [user_id]
-                    cursor.execute(f"""
-                        UPDATE user_preferences 
-                        SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-                        WHERE user_id = ?
-                    """, values)
-                else:
-                    # Insert new preferences
-                    cols = ", ".join(["user_id"] + list(preferences.keys()))
-                    placeholders = ", ".join(["?"] * (len(preferences) + 1))
-                    values = [user_id] + list(preferences.values())
-                    cursor.execute(f"""
-                        INSERT INTO user_preferences ({cols})
-                        VALUES ({placeholders})
-                    """, values)
-                
-                logger.info(f"Preferences updated for user {user_id}")
-                return True
+                columns = tuple(sorted(preferences))
+                values = [user_id] + [preferences[col] for col in columns]
+                cursor.execute(_preference_upsert_sql(columns), values)
         except sqlite3.Error as e:
             logger.error(f"Error updating preferences: {e}")
             return False
+        self._preference_cache.pop(user_id)
+        logger.info(f"Preferences updated for user {user_id}")
+        return True
 
     def get_user_preferences(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user preferences"""
-        with self.get_connection() as conn:
+        return self._read_through(self._preference_cache, user_id, self._get_user_preferences_uncached)
+
+    def _get_user_preferences_uncached(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch the preferences row from the database, bypassing the cache"""
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM user_preferences WHERE user_id = ?", (user_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            cursor.execute(_SQL.GET_USER_PREFERENCES, (user_id,))
+            return cursor.fetchone()
 
     # Playback History Operations
     def log_playback(self, user_id: str, song_id: int, 
@@ -425,17 +870,26 @@ class DatabaseManager:
             song_id: Song ID that was played
             duration_played: Optional duration played in seconds
             
+        Returns:
+            True if successful
+        """
+        return self.log_playbacks([(user_id, song_id, duration_played)])
+
+    def log_playbacks(self, rows: List[Tuple[str, int, Optional[int]]]) -> bool:
+        """
+        Log several song playbacks in a single transaction
+        
+        Args:
+            rows: (user_id, song_id, duration_played) tuples
+            
         Returns:
             True if successful
         """
         try:
-            with self.get_connection() as conn:
+            with self._write_conn() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO playback_history (user_id, song_id, duration_played)
-                    VALUES (?, ?, ?)
-                """, (user_id, song_id, duration_played))
-                logger.info(f"Playback logged for user {user_id}, song {song_id}")
+                cursor.executemany(_SQL.LOG_PLAYBACK, rows)
+                logger.info(f"{cursor.rowcount} playback(s) logged")
                 return True
         except sqlite3.Error as e:
             logger.error(f"Error logging playback: {e}")
@@ -443,30 +897,60 @@ class DatabaseManager:
 
     def get_user_history(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Get playback history for a user"""
-        with self.get_connection() as conn:
+        return list(self.iter_user_history(user_id, limit))
+
+    def iter_user_history(self, user_id: str, limit: int = 50) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a user's playback history, newest first
+        Rows are streamed from the cursor, so the pooled connection is held
+        until the iterator is exhausted or closed
+        """
+        with self._read_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_SQL.GET_USER_HISTORY, (user_id, limit))
+            yield from cursor
+
+    # Search Cache Operations
+    def get_cached_search(self, query: str) -> Optional[str]:
+        """Get the cached payload for a search query, if it has not expired"""
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT ph.*, s.title, s.artist
-                FROM playback_history ph
-                JOIN songs s ON ph.song_id = s.id
-                WHERE ph.user_id = ?
-                ORDER BY ph.played_at DESC
-                LIMIT ?
-            """, (user_id, limit))
-            return [dict(row) for row in cursor.fetchall()]
+            cursor.execute(_SQL.GET_CACHED_SEARCH, (query, int(time.time())))
+            row = cursor.fetchone()
+            return row["payload"] if row else None
+
+    def cache_search(self, query: str, payload: str, ttl: int) -> bool:
+        """
+        Store the payload for a search query
+        
+        Args:
+            query: Normalized search query
+            payload: Serialized search results
+            ttl: Seconds until the entry expires
+            
+        Returns:
+            True if successful
+        """
+        try:
+            with self._write_conn() as conn:
+                cursor = conn.cursor()
+                now = int(time.time())
+                # Drop expired entries as we go so the table can't grow without bound
+                cursor.execute(_SQL.PURGE_SEARCH_CACHE, (now,))
+                cursor.execute(_SQL.CACHE_SEARCH, (query, payload, now + ttl))
+                return True
+        except sqlite3.Error as e:
+            logger.error(f"Error caching search: {e}")
+            return False
 
     # Database Maintenance
     def get_database_stats(self) -> Dict[str, int]:
         """Get database statistics"""
-        stats = {}
-        with self.get_connection() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            
-            for table in ['users', 'songs', 'playlists', 'playback_history']:
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                stats[table] = cursor.fetchone()[0]
-        
-        return stats
+            # One round trip for all counts
+            cursor.execute(_SQL.GET_DATABASE_STATS)
+            return cursor.fetchone()
 
     def clear_history(self, user_id: Optional[str] = None) -> bool:
         """
@@ -479,14 +963,14 @@ class DatabaseManager:
             True if successful
         """
         try:
-            with self.get_connection() as conn:
+            with self._write_conn() as conn:
                 cursor = conn.cursor()
                 
                 if user_id:
-                    cursor.execute("DELETE FROM playback_history WHERE user_id = ?", (user_id,))
+                    cursor.execute(_SQL.CLEAR_USER_HISTORY, (user_id,))
                     logger.info(f"History cleared for user {user_id}")
                 else:
-                    cursor.execute("DELETE FROM playback_history")
+                    cursor.execute(_SQL.CLEAR_HISTORY)
                     logger.info("All playback history cleared")
                 
                 return True
@@ -495,10 +979,11 @@ class DatabaseManager:
             return False
 
     def close(self) -> None:
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            logger.info("Database connection closed")
+        """Shut down the database executor and close all pooled connections"""
+        self._executor.shutdown(wait=True)
+        self._writer.close()
+        self._readers.close()
+        logger.info("Database connections closed")
 
 
 # Initialize database manager
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import discord
 from discord.ext import commands
@@ -37,37 +38,47 @@ async def on_member_join(member):
 async def on_member_remove(member):
     print(f'{member} has left the server')
 
+# Static responses are built once at import time and reused on every call
+_PONG = 'Pong! {}ms'.format
+
+_HELP_EMBED = discord.Embed(
+    title='Music Bot Help',
+    description='List of available commands:',
+    color=discord.Color.blue()
+)
+_HELP_EMBED.add_field(name='!ping', value='Check bot latency', inline=False)
+_HELP_EMBED.add_field(name='!help', value='Display this help message', inline=False)
+
 # Basic ping command
 @bot.command(name='ping')
 async def ping(ctx):
     """Responds with the bot's latency"""
-    await ctx.send(f'Pong! {round(bot.latency * 1000)}ms')
+    await ctx.send(_PONG(round(bot.latency * 1000)))
 
 # Help command
 @bot.command(name='help')
 async def help_command(ctx):
     """Displays available commands"""
-    embed = discord.Embed(
-        title='Music Bot Help',
-        description='List of available commands:',
-        color=discord.Color.blue()
-    )
-    embed.add_field(name='!ping', value='Check bot latency', inline=False)
-    embed.add_field(name='!help', value='Display this help message', inline=False)
-    await ctx.send(embed=embed)
+    await ctx.send(embed=_HELP_EMBED)
 
 # Load cogs from cogs directory
 async def load_cogs():
-    """Load all cogs from the cogs directory"""
+    """Load all cogs from the cogs directory concurrently"""
     cogs_dir = 'cogs'
-    if os.path.exists(cogs_dir):
-        for filename in os.listdir(cogs_dir):
-            if filename.endswith('.py'):
-                try:
-                    await bot.load_extension(f'cogs.{filename[:-3]}')
-                    print(f'Loaded cog: {filename}')
-                except Exception as e:
-                    print(f'Failed to load cog {filename}: {e}')
+    if not os.path.exists(cogs_dir):
+        return
+    with os.scandir(cogs_dir) as it:
+        filenames = [e.name for e in it
+                     if e.is_file() and e.name.endswith('.py') and not e.name.startswith('_')]
+    results = await asyncio.gather(
+        *(bot.load_extension(f'cogs.{filename[:-3]}') for filename in filenames),
+        return_exceptions=True
+    )
+    for filename, result in zip(filenames, results):
+        if isinstance(result, Exception):
+            print(f'Failed to load cog {filename}: {result}')
+        else:
+            print(f'Loaded cog: {filename}')
 
 # Setup hook - runs when bot connects
 async def setup_hook():